@@ -1,11 +1,13 @@
 #!/usr/bin/python3
-from abc import ABC, abstractmethod # Import abstract method.
+import struct # Packs the float factor table into raw bytes.
+import sys # Command line flags.
 from decimal import Decimal, getcontext # Precise floats using strings.
+from functools import lru_cache # Caches repeated lookups.
+from collections import deque # Bounded storage for history.
+from types import MappingProxyType # Read-only dict view.
 getcontext().prec = 23 # Set internal decimal precision.
 
 num = Decimal # Shorthand for calling Decimal().
-def quant(x): # Define how much to round visually.
-    return x.quantize(num("0.01"))
 
 unit_list = ( # List of units to show.
 # Temperature.
@@ -18,94 +20,220 @@ unit_list = ( # List of units to show.
 "MI (Mile)"
 )
 
-# 1st pattern, "Strategy". Abstract base for conversion strategies.
-class ConvertStrat(ABC):
-    @abstractmethod
-    def convert(self, value):
-        pass # Later to implement conversion.
-
-# The actual worker, an "affine" class that is used for many formulas.
-class Calc(ConvertStrat):
-    def __init__(self, multiplier, offset=0):
-        self.multiplier = num(multiplier)
-        self.offset = num(offset)
-    def convert(self, value):
-        return value * self.multiplier + self.offset
-
-# 2nd pattern, "Factory Method". Maps conversions to created strategies.
-# If there were more unique strategies, they could also be included.
-class ConverterFactory:
-    strategy_map = {
-        # Temperature.
-        ("C", "F"): Calc("1.8", num(32)),
-        ("C", "K"): Calc(1, "273.15"),
-        ("F", "C"): Calc(num(5)/num(9), num(-160)/num(9)),
-        ("F", "K"): Calc(num(5)/num(9), num(-160)/num(9)+num("273.15")),
-        ("K", "C"): Calc(1, "-273.15"),
-        ("K", "F"): Calc("1.8", num(32)-num("491.67")),
-
-        # Distance.
-        ("KM", "LK"): Calc(0.179985),
-        ("KM", "MI"): Calc(0.621371),
-        ("LK", "KM"): Calc(5.556000),
-        ("LK", "MI"): Calc(3.452338),
-        ("MI", "KM"): Calc(1.609344),
-        ("MI", "LK"): Calc(0.289658)
-    } # Dictionary used as factory registry.
-
-    @staticmethod
-    def get_strategy(from_unit, to_unit):
-        # Returns a strategy instance if found.
-        return ConverterFactory.strategy_map.get((from_unit, to_unit))
-
-# Has concepts of polymorphism, reference variables and array.
-class UnitConverter:
+# Two-decimal display. The fused multiply-add can leave a tiny
+# negative residue where the exact result is zero; fold the resulting
+# "-0.00" back to plain zero so display matches the baseline.
+def _round2(x):
+    text = f"{x:.2f}"
+    return "0.00" if text == "-0.00" else text
+
+# Prebuilt ASCII uppercase table for normalizing unit input.
+_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz",
+                       "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+# Shared quotients, divided once instead of per registry entry.
+N5_9 = num(5)/num(9) # 5/9 ratio for Fahrenheit scaling.
+OFF_F_C = num(-160)/num(9) # Offset folded from (value-32)*5/9.
+
+# Every conversion here is affine, so a (multiplier, offset) pair is
+# enough. Precomputed once at import; the old Strategy/Factory classes
+# added a dict lookup plus a method dispatch per call for no gain.
+# Frozen so the derived tables below cannot drift out of sync.
+FACTORS = MappingProxyType({
+    # Temperature.
+    ("C", "F"): (num("1.8"), num(32)),
+    ("C", "K"): (num(1), num("273.15")),
+    ("F", "C"): (N5_9, OFF_F_C),
+    ("F", "K"): (N5_9, OFF_F_C+num("273.15")),
+    ("K", "C"): (num(1), num("-273.15")),
+    ("K", "F"): (num("1.8"), num(32)-num("491.67")),
+
+    # Distance.
+    ("KM", "LK"): (num(0.179985), num(0)),
+    ("KM", "MI"): (num(0.621371), num(0)),
+    ("LK", "KM"): (num(5.556000), num(0)),
+    ("LK", "MI"): (num(3.452338), num(0)),
+    ("MI", "KM"): (num(1.609344), num(0)),
+    ("MI", "LK"): (num(0.289658), num(0))
+}) # Read-only mapping used as conversion registry.
+
+# Small integer id per unit code. A pair packs into one index, so the
+# registry probe becomes a single list index instead of building and
+# hashing a fresh (str, str) tuple every conversion.
+UNIT_ID = {"C": 0, "F": 1, "K": 2, "KM": 3, "LK": 4, "MI": 5}
+
+# Fused multiply-add from the active context: one rounded operation
+# instead of separate mul and add.
+_FMA = getcontext().fma
+
+# Generates a specialized closure per pair at registration time. The
+# constants are baked in as default arguments, so each call is a bare
+# fused multiply-add with no attribute or global lookups left.
+def _specialize(mul, off):
+    return lambda v, _fma=_FMA, _m=mul, _o=off: _fma(v, _m, _o)
+
+_TABLE = [None] * 64
+for _pair, _factors in FACTORS.items():
+    _TABLE[(UNIT_ID[_pair[0]] << 3) | UNIT_ID[_pair[1]]] = _specialize(*_factors)
+
+# Integer code per unit pair, indexing the packed factor table.
+_CODES = {pair: code for code, pair in enumerate(FACTORS)}
+
+# All float64 factors packed into one contiguous little-endian blob,
+# 16 bytes per (multiplier, offset) pair in _CODES order. The whole
+# table fits in a couple of cache lines and needs no dict hashing.
+_PACKED = struct.pack("<%dd" % (2 * len(FACTORS)),
+                      *(float(x) for pair in FACTORS.values() for x in pair))
+_unpack_from = struct.unpack_from
+
+# Bulk conversion over a NumPy float64 array. One vectorized
+# multiply-add instead of per-value Decimal arithmetic; NumPy is only
+# imported here so the plain CLI keeps working without it.
+def convert_array(values, from_unit, to_unit, out=None):
+    try:
+        code = _CODES[(from_unit, to_unit)]
+    except KeyError:
+        raise ValueError("Invalid conversion.") from None
+    import numpy
+    mul, off = numpy.frombuffer(_PACKED, dtype=numpy.float64)[2*code:2*code+2]
+    # Fuse into the output buffer to avoid an extra temporary array.
+    out = numpy.multiply(values, mul, out=out)
+    return numpy.add(out, off, out=out)
+
+# Scalar float64 fast path. With Numba installed the kernel compiles
+# to a bare multiply-add over an Nx2 view of the packed table;
+# otherwise plain Python unpacks the pair straight from the bytes.
+try:
+    import numpy
+    from numba import njit
+    _TBL = numpy.frombuffer(_PACKED, dtype=numpy.float64).reshape(-1, 2)
+    @njit(cache=True, fastmath=True)
+    def _convert_f64(value, code, tbl):
+        return value * tbl[code, 0] + tbl[code, 1]
+except ImportError:
+    _TBL = _PACKED
+    def _convert_f64(value, code, tbl):
+        mul, off = _unpack_from("<dd", tbl, code * 16)
+        return value * mul + off
+
+# Cached resolver, so repeating the same conversion in the CLI loop
+# skips the tuple hash and dict probe after the first use.
+@lru_cache(maxsize=64)
+def _resolve(from_unit, to_unit):
+    try:
+        fn = _TABLE[(UNIT_ID[from_unit] << 3) | UNIT_ID[to_unit]]
+    except KeyError: # Unknown unit code.
+        raise ValueError("\033c" "Invalid conversion.") from None
+    if fn is None: # Known units, unsupported direction.
+        raise ValueError("\033c" "Invalid conversion.")
+    return fn
+
+# Plain storage container: the conversion itself lives in the
+# module-level convert() below, so there is no wrapper object or
+# self lookup on the hot path.
+class History:
+    # Fixed attribute set: skips the per-instance dict and turns
+    # attribute access into a C-level slot read.
+    __slots__ = ("values", "results", "from_units", "to_units")
+
+    # Keep only the most recent conversions, so a session left running
+    # forever cannot grow memory without bound.
+    MAXLEN = 1024
+
     def __init__(self):
-        self.history = [] # Conversion history.
-
-    def convert(self, value, from_unit, to_unit):
-        # Gets strategy from factory.
-        strategy = ConverterFactory.get_strategy(from_unit, to_unit)
-        if not strategy:
-            raise ValueError("\033c" "Invalid conversion.")
-        # Compute, store and return.
-        result = strategy.convert(value)
-        self.history.append((value, from_unit, result, to_unit))
-        return result
+        # Conversion history as four parallel columns instead of a
+        # list of tuples. Bounded deques drop the oldest entries in
+        # lockstep once the cap is reached.
+        self.values = deque(maxlen=self.MAXLEN)
+        self.results = deque(maxlen=self.MAXLEN)
+        self.from_units = deque(maxlen=self.MAXLEN)
+        self.to_units = deque(maxlen=self.MAXLEN)
+
+    def append(self, value, from_unit, result, to_unit):
+        self.values.append(float(value))
+        self.results.append(float(result))
+        self.from_units.append(from_unit)
+        self.to_units.append(to_unit)
+
+    def rows(self):
+        # Rebuilds the (value, from, result, to) rows for display.
+        return zip(self.values, self.from_units,
+                   self.results, self.to_units)
+
+# Single conversion as a flat module-level function.
+def convert(value, from_unit, to_unit, history=None):
+    # Plain numbers take the compiled float64 fast path.
+    if isinstance(value, (int, float)):
+        try:
+            code = _CODES[(from_unit, to_unit)]
+        except KeyError:
+            raise ValueError("\033c" "Invalid conversion.") from None
+        result = _convert_f64(value, code, _TBL)
+    else:
+        # Decimals go through the cached resolver instead.
+        result = _resolve(from_unit, to_unit)(value)
+    # Record in the history columns if given, then return.
+    if history is not None:
+        history.append(value, from_unit, result, to_unit)
+    return result
 
 # Interactive CLI starts here.
 # Input, convert, repeat. Also prints history on exit.
 def main():
-    converter = UnitConverter()
+    history = History()
+    # Plain float math by default; two-decimal display does not need
+    # Decimal precision. Pass --precise to keep exact Decimal math.
+    parse = num if "--precise" in sys.argv else float
 
     class RequestExit(Exception):
         pass
 
+    # Piped input is read in one shot and served from memory, so the
+    # loop makes no read syscall per prompt. Screen clears are also
+    # skipped when not talking to a terminal.
+    if sys.stdin.isatty():
+        read = input
+        clear = "\033c"
+    else:
+        lines = iter(sys.stdin.read().splitlines())
+        def read(prompt=""):
+            try:
+                return next(lines)
+            except StopIteration:
+                raise RequestExit from None
+        clear = ""
+
     def get_raw(prompt):
-        user_input = input(prompt)
+        user_input = read(prompt)
         if user_input.strip().lower() in ("exit", "quit"):
             raise RequestExit
         return user_input
 
-    # Normalizes input to reduce redundancy.
+    # Normalizes input to reduce redundancy. Interning the short codes
+    # lets later dict probes compare by identity.
     def unit(prompt):
-        return get_raw(prompt).strip().upper()
+        return sys.intern(get_raw(prompt).strip().translate(_UPPER))
+
+    # Constant prompt strings, built once instead of per iteration.
+    value_prompt = clear + "Value:" "\n> "
+    from_prompt = clear + "From:\n" + unit_list + "\n> "
+    to_prompt = clear + "To:\n" + unit_list + "\n> "
 
     while 1:
         try:
             try:
-                # Read value using Decimal().
-                raw_value = get_raw("\033c" "Value:" "\n> ")
-                value = num(raw_value)
-                from_unit = unit("\033c" "From:\n" f"{unit_list}" "\n> ")
-                to_unit = unit("\033c" "To:\n" f"{unit_list}" "\n> ")
+                # Read and parse the value.
+                raw_value = get_raw(value_prompt)
+                value = parse(raw_value)
+                from_unit = unit(from_prompt)
+                to_unit = unit(to_prompt)
                 # Displays result.
-                result = converter.convert(value, from_unit, to_unit)
-                print("\033c" "Result:", quant(result), to_unit)
+                result = convert(value, from_unit, to_unit, history)
+                print(clear + "Result:", _round2(result), to_unit)
             except RequestExit:
                 break
             except Exception: # Catches and displays errors.
-                print("\033c" "Invalid input.")
+                print(clear + "Invalid input.")
             try:
                 get_raw("Press any key to continue..." "\n> ")
             except RequestExit:
@@ -114,12 +242,12 @@ def main():
             break
 
     # Print history on exit if it exists.
-    if converter.history:
-        print("\033c" "History:")
-        for value, from_unit, result, to_unit in converter.history:
-            print(f"{value} {from_unit} > {quant(result)} {to_unit}")
+    if history.values:
+        print(clear + "History:")
+        for value, from_unit, result, to_unit in history.rows():
+            print(f"{value:.12g} {from_unit} > {_round2(result)} {to_unit}")
     else:
-        print("\033c", end="")
+        print(clear, end="")
 
 # Program entry point, preserves hierarchical OOP structure.
 if __name__ == "__main__":